@@ -16,9 +16,14 @@
 
 import os
 import sys
-import re
 import json
 import shutil
+import functools
+
+try:
+    import orjson  # Much faster than json for reading and writing the database, if it's available
+except ImportError:
+    orjson = None
 
 ###VERSIONS###
 
@@ -28,6 +33,16 @@ file_version = 5
 
 #############
 
+_VERSIONS = {"prog_internal_version": prog_internal_version, "file_version": file_version, "version": version}
+
+_BAD_NAME_CHARS = frozenset(" #")  # Characters char_check() looks for
+
+_SHELL_FILES = {"bash": ".bashrc", "zsh": ".zshrc"}  # Shell name to the file in ~ it reads on startup
+
+_LOCK_PATH = "/tmp/hamstall-lock"  # Already a full path, so it never needs to go through full()
+
+db = None  # Database, read from disk the first time get_db_cached() is called
+
 
 def check_bin(bin):
     """Check for Binary on System.
@@ -41,23 +56,22 @@ def check_bin(bin):
     return shutil.which(bin) is not None
 
 
+@functools.lru_cache(maxsize=1)
 def get_shell_file():
     """Get Shell File.
 
     Attempts to automatically obtain the file used by the user's shell for PATH,
-    variable exporting, etc.
+    variable exporting, etc. $SHELL won't change while hamstall runs, so the result is cached.
 
     Returns:
         str: File name in home directory to store PATHs, variables, etc.
 
     """
     vprint("Auto-detecting shell")
-    shell = os.environ["SHELL"]
-    if "bash" in shell:
-        return ".bashrc"
-    elif "zsh" in shell:
-        return ".zshrc"
-    else:
+    shell = os.path.basename(os.environ.get("SHELL", ""))
+    try:
+        return _SHELL_FILES[shell]
+    except KeyError:
         vprint("Couldn't auto-detect shell environment! Defaulting to bash...")
         return ".bashrc"
 
@@ -72,7 +86,7 @@ def read_config(key):
 
 """
     try:
-        return db["options"][key]
+        return get_db_cached()["options"][key]
     except KeyError:
         if key in ["Verbose", "AutoInstall"]:
             return False
@@ -86,7 +100,9 @@ def read_config(key):
 def change_config(key, mode, value=None):
     """Change Config Value.
 
-    Flips a value in the config between true and false
+    Flips a value in the config between true and false. The change is only made in memory;
+    it's written to disk with the rest of the database by write_db(), which generic.leave()
+    calls once at the end of every command.
 
     Args:
         key (str): Key to change the value of
@@ -99,19 +115,26 @@ def change_config(key, mode, value=None):
     """
     if mode == 'flip':
         try:
-            db["options"][key] = not db["options"][key]
-            return db["options"][key]
+            return _set_option(key, not get_db_cached()["options"][key])
         except KeyError:  # All config values are False by default, so this should make them True.
-            db["options"].update({key: True})
-            return True
+            return _set_option(key, True)
     elif mode == 'change':
-        try:
-            db["options"][key] = value
-            return value
-        except KeyError:
-            db["options"].update({key: value})
-            return value
-    write_db()
+        return _set_option(key, value)
+
+
+def _set_option(key, value):
+    """Set Option.
+
+    Stores a value in the database's options, keeping verbosity in sync
+
+    Returns:
+        Any type: The value that was set
+
+    """
+    get_db_cached()["options"][key] = value
+    if key == "Verbose":
+        set_verbose(value)
+    return value
 
 
 def vcheck():
@@ -124,11 +147,33 @@ def vcheck():
     return read_config('Verbose')
 
 
+def _quiet_print(to_print):
+    """Stand-in for vprint when we aren't verbose"""
+    pass
+
+
+def set_verbose(state):
+    """Set Verbosity.
+
+    Binds vprint straight to print when verbose, or to a no-op otherwise, so vprint doesn't
+    need to check whether or not we're verbose each time it's called.
+
+    Args:
+        state (bool): Whether or not we should be verbose
+
+    """
+    global vprint
+    vprint = print if state else _quiet_print
+
+
 def vprint(to_print):
-    """Print a message only if we're verbose"""
-    global verbose
-    if verbose:
-        print(to_print)
+    """Print a message only if we're verbose.
+
+    Works out whether we're verbose on first use, then gets replaced by set_verbose()
+
+    """
+    set_verbose(vcheck())
+    vprint(to_print)
 
 
 def get_version(version_type):
@@ -141,12 +186,7 @@ def get_version(version_type):
         str/int: Version of the type specified. Int for prog/file and str for version.
 
     """
-    if version_type == 'prog_internal_version':
-        return prog_internal_version
-    elif version_type == 'file_version':
-        return file_version
-    elif version_type == 'version':
-        return version
+    return _VERSIONS.get(version_type)
 
 
 def lock():
@@ -155,14 +195,14 @@ def lock():
     Lock hamstall to prevent multiple instances of hamstall being used alongside each other
 
     """
-    create("/tmp/hamstall-lock")
+    create(_LOCK_PATH)
     vprint("Lock created!")
 
 
 def unlock():
     """Remove hamstall lock."""
     try:
-        os.remove(full("/tmp/hamstall-lock"))
+        os.remove(_LOCK_PATH)
     except FileNotFoundError:
         pass
     vprint("Lock removed!")
@@ -171,12 +211,17 @@ def unlock():
 def write_db():
     """Write Database.
 
-    Writes the database to file
+    Writes the database to file atomically, by writing a temporary file then moving it into place
 
     """
+    db = get_db_cached()
     try:
-        with open(full("~/.hamstall/database"), "w") as dbf:
-            json.dump(db, dbf)
+        temp_path = full("~/.hamstall/database.tmp")  # An interrupted write here can't corrupt the real database
+        with open(temp_path, "wb") as dbf:
+            dbf.write(_dumps(db))
+            dbf.flush()
+            os.fsync(dbf.fileno())
+        os.replace(temp_path, full("~/.hamstall/database"))
     except FileNotFoundError:
         print(json.dumps(db))
         print("The hamstall database could not be written to! Something is very wrong...")
@@ -186,6 +231,28 @@ def write_db():
         sys.exit(3)
 
 
+def _dumps(obj):
+    """Serialize to JSON bytes, using orjson if it's installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
+def _loads(data):
+    """Deserialize JSON, using orjson if it's installed.
+
+    Args:
+        data (bytes): UTF-8 encoded JSON
+
+    Raises:
+        json.decoder.JSONDecodeError: If data isn't valid JSON (orjson's error is a subclass of it)
+
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data.decode())  # json.loads only takes bytes on Python 3.6 and up
+
+
 def name(program):
     """Get Program Name.
 
@@ -198,9 +265,10 @@ def name(program):
         str: Name of program to use internally
 
     """
-    program_internal_name = re.sub(r'.*/', '/', program)
+    program_internal_name = program.rpartition('/')[2]  # Strip everything up to the last /
     extension_length = len(extension(program))
-    program_internal_name = program_internal_name[1:(len(program_internal_name) - extension_length)]
+    if extension_length:
+        program_internal_name = program_internal_name[:-extension_length]
     return program_internal_name
 
 
@@ -214,9 +282,10 @@ def extension(program):
         str: Extension of program
 
     """
-    if program[-3:].lower() == '.7z':
-        return program[-3:].lower()
-    elif program[-4:].lower() in ['.zip', '.rar', '.git']:
+    lower_program = program.lower()
+    if lower_program.endswith('.7z'):
+        return '.7z'
+    elif lower_program.endswith(('.zip', '.rar', '.git')):
         return program[-4:]
     else:
         # Default to returning the last 7 characters
@@ -233,10 +302,9 @@ def exists(file_name):
         bool: Whether the file exists or not
 
     """
-    try:
-        return os.path.isfile(full(file_name))
-    except FileNotFoundError:
-        return False
+    if file_name.startswith("/") and "~" not in file_name:  # Already a full path; the OS can resolve it as is
+        return os.path.isfile(file_name)
+    return os.path.isfile(full(file_name))
 
 
 def locked():
@@ -246,7 +314,7 @@ def locked():
         bool: True if hamstall is locked. False otherwise.
 
     """
-    return exists("/tmp/hamstall-lock")
+    return os.path.isfile(_LOCK_PATH)
 
 
 def full(file_name):
@@ -261,6 +329,14 @@ def full(file_name):
         str: Converted path
 
     """
+    if file_name.startswith(("/", "~")):  # Doesn't depend on the working directory, so it's safe to cache
+        return _full_cached(file_name)
+    return os.path.abspath(os.path.expanduser(file_name))
+
+
+@functools.lru_cache(maxsize=256)
+def _full_cached(file_name):
+    """Cached full() for paths that don't depend on the working directory."""
     return os.path.abspath(os.path.expanduser(file_name))
 
 
@@ -289,17 +365,14 @@ def replace_in_file(old, new, file_path):
         new (str): String to replace with
         file (str): Path to file to replace strings in
     """
-    rewrite = """"""
     file_path = full(file_path)
-    f = open(file_path, 'r')
-    open_file = f.readlines()
-    f.close()
-    for l in open_file:
-        rewrite += l.replace(old, new)
-    written = open(file_path, 'w')
-    written.write(str(rewrite))
-    written.close()  # Write then close our new copy of the file
-    return
+    with open(file_path, 'r', newline='') as f:  # newline='' keeps the file's line endings as they are
+        contents = f.read()
+    if old not in contents:
+        return  # Nothing to replace, so don't rewrite the file
+    rewrite = contents.replace(old, new)
+    with open(file_path, 'w', newline='') as written:
+        written.write(rewrite)  # Write our new copy of the file
 
 
 def check_line(line, file_path, mode):
@@ -318,28 +391,27 @@ def check_line(line, file_path, mode):
         bool: Whether or not the line/word is in the file
 
     """
-    f = open(full(file_path), 'r')
-    open_file = f.readlines()
-    f.close()
-    for l in open_file:
-        if mode == 'word':
-            new_l = l.rstrip()
-            new_l = new_l.split()
-        elif mode == 'fuzzy':
-            new_l = l.rstrip()
-        if line in new_l:
-            return True
+    with open(full(file_path), 'r') as f:
+        for l in f:  # Read lazily so we can stop at the first match
+            if mode == 'word':
+                new_l = l.rstrip()
+                new_l = new_l.split()
+            elif mode == 'fuzzy':
+                new_l = l.rstrip()
+            if line in new_l:
+                return True
     return False
 
 
 def create(file_path):
     """Create Empty File.
+
+    Creates the file if it doesn't exist, and empties it if it does.
     
     Args:
         file_path (str): Path to file to create
     """
-    f = open(full(file_path), "w+")
-    f.close()
+    os.close(os.open(full(file_path), os.O_CREAT | os.O_WRONLY | os.O_TRUNC, 0o666))
 
 
 def remove_line(line, file_path, mode):
@@ -356,36 +428,33 @@ def remove_line(line, file_path, mode):
         mode (str): Mode to use to find lines to remove
 
     """
-    rewrite = """"""
     file_path = full(file_path)
-    f = open(file_path, 'r')
-    open_file = f.readlines()
-    f.close()
-    for l in open_file:
-        if mode == 'word' or mode == 'poundword':
-            new_l = l.rstrip()
-            new_l = new_l.split()
-        elif mode == 'fuzzy':
-            new_l = l.rstrip()
-        if line in new_l:
-            if not ('#' in new_l) and mode == 'poundword':
-                rewrite += l
+    kept = []
+    removed = False
+    with open(file_path, 'r', newline='') as f:  # newline='' keeps the file's line endings as they are
+        for l in f:
+            if mode == 'word' or mode == 'poundword':
+                new_l = l.rstrip()
+                new_l = new_l.split()
+            elif mode == 'fuzzy':
+                new_l = l.rstrip()
+            if line in new_l:
+                if not ('#' in new_l) and mode == 'poundword':
+                    kept.append(l)
+                else:
+                    removed = True
             else:
-                pass
-        else:
-            rewrite += l
-    written = open(file_path, 'w')
-    written.write(str(rewrite))
-    written.close()  # Write then close our new copy of the file
-    return
+                kept.append(l)
+    if not removed:
+        return  # No lines matched, so don't rewrite the file
+    with open(file_path, 'w', newline='') as written:
+        written.write("".join(kept))  # Write our new copy of the file
 
 
 def add_line(line, file_path):
     """Adds Line to a File."""
-    file_path = full(file_path)
-    f = open(file_path, 'a')
-    f.write(line)
-    f.close()
+    with open(full(file_path), 'a') as f:
+        f.write(line)
 
 
 def char_check(name):
@@ -397,7 +466,7 @@ def char_check(name):
         bool: True if line contains space or #; False otherwise
 
     """
-    return ' ' in name or '#' in name
+    return not _BAD_NAME_CHARS.isdisjoint(name)
 
 
 """
@@ -432,8 +501,8 @@ def get_db():
 
     """
     try:
-        with open(full("~/.hamstall/database")) as f:
-            db = json.load(f)
+        with open(full("~/.hamstall/database"), "rb") as f:
+            db = _loads(f.read())  # Read the whole file in one go
     except FileNotFoundError:
         db = {}
     except json.decoder.JSONDecodeError:
@@ -449,9 +518,29 @@ def get_db():
     return db
 
 
-db = get_db()
-verbose = vcheck()
-try:
-    branch = db["version"]["branch"]
-except KeyError:
-    branch = "master"
\ No newline at end of file
+def get_db_cached():
+    """Get Loaded Database.
+
+    Reads the database from disk the first time it's needed, rather than when hamstall starts.
+
+    Returns:
+        dict: Database currently in use
+
+    """
+    global db
+    if db is None:
+        db = get_db()
+    return db
+
+
+def get_branch():
+    """Get Branch.
+
+    Returns:
+        str: Branch of hamstall the user is on. Defaults to master if the database doesn't have one.
+
+    """
+    try:
+        return get_db_cached()["version"]["branch"]
+    except KeyError:
+        return "master"
@@ -64,7 +64,7 @@ username = getpass.getuser()  # Root check
 if username == 'root':
     print('Note: Running as root user will install programs for the root user to use!')
 
-if config.db == {"refresh": True}:  # Downgrade check
+if config.get_db_cached() == {"refresh": True}:  # Downgrade check. Also loads the database for config.db below
     print("Hang tight! We're finishing up your downgrade...")
     config.create("~/.hamstall/database")
     prog_manage.create_db()
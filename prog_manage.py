@@ -84,10 +84,10 @@ E - Exit branch wizard and don't change branches.
     if ans == 'e':
         print("Not changing branches!")
         generic.leave()
-    elif ans == 'm' and config.db["version"]["branch"] == "master":
+    elif ans == 'm' and config.get_branch() == "master":
         print("Already on the master branch, not switching!")
         generic.leave()
-    elif ans == 'b' and config.db["version"]["branch"] == "beta":
+    elif ans == 'b' and config.get_branch() == "beta":
         print("Already on the beta branch, not switching!")
         generic.leave()
     else:
@@ -109,7 +109,7 @@ E - Exit branch wizard and don't change branches.
             branch = "beta"
         print("Changing branches and updating hamstall!")
         config.vprint("Switching branch and writing change to file")
-        config.db["version"]["branch"] = branch
+        config.get_db_cached()["version"]["branch"] = branch
         config.write_db()
         if branch == "beta":
             config.vprint("Updating hamstall...")
@@ -175,7 +175,7 @@ b - Swap branches in hamstall. Allows you to get updates sooner at the cost of p
 e - Exit hamstall
         """.format(
             au=generic.endi(config.read_config("AutoInstall")), v=generic.endi(config.read_config("Verbose")),
-            b=config.db["version"]["branch"]
+            b=config.get_branch()
         ))
         option = generic.get_input("[au/v/b/E] ", ['au', 'v', 'b', 'e'], 'e')
         if option == 'au':
@@ -205,20 +205,21 @@ def remove_desktop(program):
         program (str): Program to remove
 
     """
-    if not config.db["programs"][program]["desktops"]:
+    desktops = config.get_db_cached()["programs"][program]["desktops"]
+    if not desktops:
         print("Program has no .desktop files!")
     else:
         print("Desktops: ")
-        for d in config.db["programs"][program]["desktops"]:
+        for d in desktops:
             print(d)
         inp = "/ choose desktop"
-        while not (inp in config.db["programs"][program]["desktops"]) and inp != "exit":
+        while not (inp in desktops) and inp != "exit":
             inp = input("Please enter the desktop you would like to remove or type \"exit\" to exit: ")
         try:
             os.remove(config.full("~/.local/share/applications/{}.desktop".format(inp)))
         except FileNotFoundError:
             pass
-        config.db["programs"][program]["desktops"].remove(inp)
+        desktops.remove(inp)
 
 
 def rename(program):
@@ -227,10 +228,11 @@ def rename(program):
         new_name = input("Please enter the name you would like to change this program to: ")
         if not new_name.replace("_", "").replace("-", "").isalnum():
             print("Alphanumeric characters, dashes, and underscores only, please!")
-    for d in config.db["programs"][program]["desktops"]:
+    programs = config.get_db_cached()["programs"]
+    for d in programs[program]["desktops"]:
         config.replace_in_file("/.hamstall/bin/{}".format(program), "/.hamstall/bin/{}".format(new_name), 
         "~/.local/share/applications/{}.desktop".format(d))
-    config.db["programs"][new_name] = config.db["programs"].pop(program)
+    programs[new_name] = programs.pop(program)
     config.replace_in_file("export PATH=$PATH:~/.hamstall/bin/" + program, 
     "export PATH=$PATH:~/.hamstall/bin/" + new_name, "~/.hamstall/.bashrc")
     config.replace_in_file("'cd " + config.full('~/.hamstall/bin/' + program),
@@ -255,7 +257,7 @@ def finish_install(program_internal_name):
     except FileNotFoundError:
         pass
     config.vprint("Adding program to hamstall list of programs")
-    config.db["programs"].update({program_internal_name: {"desktops": []}})
+    config.get_db_cached()["programs"].update({program_internal_name: {"desktops": []}})
     config.write_db()
     yn = generic.get_input('Would you like to add the program to your PATH? [Y/n]', ['y', 'n'], 'y')
     if yn == 'y':
@@ -349,7 +351,7 @@ Categories={categories}
     config.create("./{}.desktop".format(desktop_name))
     with open(config.full("./{}.desktop".format(desktop_name)), 'w') as f:
         f.write(to_write)
-    config.db["programs"][program_internal_name]["desktops"].append(desktop_name)
+    config.get_db_cached()["programs"][program_internal_name]["desktops"].append(desktop_name)
     print("\nDesktop file created!")
 
 
@@ -529,7 +531,7 @@ def update(silent=False):
                 os.remove(config.full('~/.hamstall/' + i))
         config.vprint("Downloading new hamstall pys..")
         download_files(['hamstall.py', 'generic.py', 'config.py', 'config.py', 'prog_manage.py'], '~/.hamstall/')
-        config.db["version"]["prog_internal_version"] = final_version
+        config.get_db_cached()["version"]["prog_internal_version"] = final_version
     elif final_version < prog_version_internal:
         if not silent:
             print("hamstall version newer than latest online version! Something might be wrong...")
@@ -546,9 +548,10 @@ def erase():
     config.vprint('Removing source line from bashrc')
     config.remove_line("~/.hamstall/.bashrc", "~/{}".format(config.read_config("ShellFile")), "word")
     config.vprint("Removing .desktop files")
-    for prog in config.db["programs"]:
-        if config.db["programs"][prog]["desktops"]:
-            for d in config.db["programs"][prog]["desktops"]:
+    programs = config.get_db_cached()["programs"]
+    for prog in programs:
+        if programs[prog]["desktops"]:
+            for d in programs[prog]["desktops"]:
                 try:
                     os.remove(config.full("~/.local/share/applications/{}.desktop".format(d)))
                 except FileNotFoundError:
@@ -722,7 +725,7 @@ def install(program, overwrite=False):
         dest = config.full('~/.hamstall/bin/' + program_internal_name + "/")
     config.vprint("Moving program to directory")
     if overwrite:
-        if verbose:
+        if config.vcheck():
             verbose_flag = "v"
         else:
             verbose_flag = ""
@@ -773,26 +776,27 @@ def uninstall(program):
     config.vprint("Removing program from PATH and any binlinks for the program")
     config.remove_line(program, "~/.hamstall/.bashrc", 'poundword')
     config.vprint("Removing program desktop files")
-    if config.db["programs"][program]["desktops"]:
-        for d in config.db["programs"][program]["desktops"]:
+    programs = config.get_db_cached()["programs"]
+    if programs[program]["desktops"]:
+        for d in programs[program]["desktops"]:
             try:
                 os.remove(config.full("~/.local/share/applications/{}.desktop".format(d)))
             except FileNotFoundError:
                 pass
     config.vprint("Removing program from hamstall list of programs")
-    del config.db["programs"][program]
+    del programs[program]
     print("Uninstall complete!")
     return
 
 
 def list_programs():
     """List Installed Programs."""
-    for prog in config.db["programs"].keys():
+    for prog in config.get_db_cached()["programs"].keys():
         print(prog)
     generic.leave()
 
 
-def get_online_version(type_of_replacement, branch=config.branch):
+def get_online_version(type_of_replacement, branch=None):
     """Get hamstall Version from GitHub.
 
     Args:
@@ -805,6 +809,8 @@ def get_online_version(type_of_replacement, branch=config.branch):
     if not can_update:
         print("requests library not installed! Exiting...")
         generic.leave(1)
+    if branch is None:
+        branch = config.get_branch()
     version_url = "https://raw.githubusercontent.com/hammy3502/hamstall/{}/version".format(branch)
     version_raw = requests.get(version_url)
     version = version_raw.text
@@ -828,9 +834,9 @@ def get_file_version(version_type):
 
     """
     if version_type == 'file':
-        return config.db["version"]["file_version"]
+        return config.get_db_cached()["version"]["file_version"]
     elif version_type == 'prog':
-        return config.db["version"]["prog_internal_version"]
+        return config.get_db_cached()["version"]["prog_internal_version"]
 
 
 def download_files(files, folder):
@@ -846,8 +852,6 @@ def download_files(files, folder):
         generic.leave(1)
     for i in files:
         r = requests.get(
-            "https://raw.githubusercontent.com/hammy3502/hamstall/{}/".format(config.db["version"]["branch"]) + i)
-        open(config.full(folder + i), 'wb').write(r.content)
-
-
-verbose = config.vcheck()
+            "https://raw.githubusercontent.com/hammy3502/hamstall/{}/".format(config.get_branch()) + i)
+        with open(config.full(folder + i), 'wb') as f:
+            f.write(r.content)
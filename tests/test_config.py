@@ -9,6 +9,19 @@ def test_check_bin():
     assert config.check_bin("agtasdytfhgasdfsudyghaushdgj") is False
 
 
+def test_get_shell_file(monkeypatch):
+    config.get_shell_file.cache_clear()
+    monkeypatch.setenv("SHELL", "/usr/bin/zsh")
+    assert config.get_shell_file() == ".zshrc"
+    config.get_shell_file.cache_clear()
+    monkeypatch.setenv("SHELL", "/opt/bash-completion/fish")
+    assert config.get_shell_file() == ".bashrc"
+    config.get_shell_file.cache_clear()
+    monkeypatch.setenv("SHELL", "/bin/bash")
+    assert config.get_shell_file() == ".bashrc"
+    config.get_shell_file.cache_clear()
+
+
 def test_replace_in_file():
     with open("/tmp/hamstall-test-temp", "w") as f:
         f.write("Test Line.")
@@ -40,6 +53,20 @@ def test_vcheck():
     assert config.vcheck() is False
 
 
+def test_get_version():
+    assert config.get_version("version") == config.version
+    assert config.get_version("file_version") == config.file_version
+    assert config.get_version("prog_internal_version") == config.prog_internal_version
+
+
+def test_set_verbose(capsys):
+    config.set_verbose(True)
+    config.vprint("Shown")
+    config.set_verbose(False)
+    config.vprint("Hidden")
+    assert capsys.readouterr().out == "Shown\n"
+
+
 def test_lock():
     config.lock()
     assert os.path.isfile("/tmp/hamstall-lock")
@@ -77,6 +104,7 @@ def test_name():
     assert config.name("/some/directory/config.tar.gz") == "config"
     assert config.name("~/i/was/home/but/now/im/here.zip") == "here"
     assert config.name("./tar/xz/files/are/pretty/cool.tar.xz") == "cool"
+    assert config.name("nodirectory.zip") == "nodirectory"
 
 
 def test_extension():
@@ -126,8 +154,8 @@ def test_char_check():
 
 
 def test_write_db():
-    old_db = config.db
-    config.db.update({"test": "here"})
+    old_db = config.get_db_cached()
+    config.get_db_cached().update({"test": "here"})
     config.write_db()
     old_db.update({"test": "here"})
     with open(config.full("~/.hamstall/database")) as f: